@@ -8,19 +8,154 @@ Usage:
 
 Requirements:
     pip install requests pyjwt
+    pip install orjson  # optional, faster JSON handling
 """
 
-import argparse
 import json
+import mimetypes
 import sys
+import threading
 import time
 import os
-from datetime import datetime, timezone
+import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
 
-import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is an optional, faster drop-in for the JSON request/response paths
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# (connect, read) timeout in seconds applied to every request
+DEFAULT_TIMEOUT = (5, 30)
+
+# WAV fmt chunk format tags: PCM, IEEE float and WAVE_FORMAT_EXTENSIBLE
+WAV_FORMAT_TAGS = (0x0001, 0x0003, 0xFFFE)
+
+class _PostSafeRetry(Retry):
+    """Retry policy that only resends a POST when the server did not process it."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # POSTs such as create-subject are not idempotent: a 500, 502 or 504
+        # may come after the backend already handled the request, so only
+        # a rate limit or an explicit "retry later" is safe to resend
+        if method and method.upper() == 'POST' and not (
+                status_code == 429 or (status_code == 503 and has_retry_after)):
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Transient failures are retried inside the connection pool, honoring
+# Retry-After. The final response is returned rather than raised, so
+# callers still see it through raise_for_status(). Read timeouts are not
+# retried, and POSTs are only retried on 429 and 503 with Retry-After:
+# otherwise the server may already have processed the request, and
+# resending a POST such as create-subject would duplicate it.
+DEFAULT_RETRY = _PostSafeRetry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'POST', 'PUT'}),
+    raise_on_status=False
+)
+
+# Connections kept per host by the session's pool
+DEFAULT_POOL_SIZE = 16
+
+# Bytes read from disk per socket write when streaming an upload body
+UPLOAD_BLOCKSIZE = 64 * 1024
+
+
+def _parse_json(response: requests.Response):
+    """Decode a JSON response body, raising a RequestException if it is malformed."""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON response: {e}", response=response)
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ISO 8601 with milliseconds, e.g. 2024-01-31T12:00:00.123Z."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f'.{nanos // 1_000_000:03d}Z'
+
+
+def _parse_wav_header(audio_file: BinaryIO) -> Tuple[int, int, int, int]:
+    """
+    Read the format of a WAV file from its RIFF header.
+
+    Walks the RIFF chunks with struct until both the fmt and data chunks
+    have been seen, leaving the sample data unread.
+
+    Returns:
+        Tuple of (channels, sample_rate, sample_width, frames)
+
+    Raises:
+        ValueError: If the file is not a PCM or float RIFF/WAVE file
+    """
+    header = audio_file.read(12)
+    if len(header) < 12:
+        raise ValueError("File too short for a WAV header")
+    riff, _, wave_id = struct.unpack('<4sI4s', header)
+    if riff != b'RIFF' or wave_id != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    while True:
+        chunk_header = audio_file.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("Missing fmt or data chunk")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                raise ValueError("fmt chunk too short")
+            fmt_data = audio_file.read(16)
+            if len(fmt_data) < 16:
+                raise ValueError("fmt chunk truncated")
+            fmt_tag, channels, sample_rate, _, _, bits = struct.unpack('<HHIIHH', fmt_data)
+            if fmt_tag not in WAV_FORMAT_TAGS:
+                raise ValueError(f"Unsupported WAV format tag: {fmt_tag:#06x}")
+            fmt = (channels, sample_rate, (bits + 7) // 8)
+            skip = chunk_size - 16
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError("data chunk before fmt chunk")
+            channels, sample_rate, sample_width = fmt
+            frame_size = channels * sample_width
+            frames = chunk_size // frame_size if frame_size else 0
+            return channels, sample_rate, sample_width, frames
+        else:
+            skip = chunk_size
+
+        # Chunks are padded to an even number of bytes
+        audio_file.seek(skip + (chunk_size & 1), os.SEEK_CUR)
+
+
+class _StreamingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send file bodies in UPLOAD_BLOCKSIZE blocks."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('blocksize', UPLOAD_BLOCKSIZE)
+        super().init_poolmanager(*args, **kwargs)
 
 
 class CanarySpeechClient:
@@ -31,6 +166,37 @@ class CanarySpeechClient:
         'jpe': 'https://rest.jpe.canaryspeech.com'   # Japan East
     }
 
+    # v3 endpoint paths, resolved against the region's base URL per client
+    ENDPOINTS = (
+        'auth/tokens/get',
+        'auth/tokens/refresh',
+        'api/create-subject',
+        'api/assessment/begin',
+        'api/assessment/end',
+        'api/assessment/poll',
+        'api/list-scores',
+    )
+
+    # Upper bounds on WAV header fields; anything beyond these is rejected
+    # before upload rather than paying for an upload the API cannot score
+    MAX_SAMPLE_RATE = 384000
+    MAX_DURATION = 600  # seconds
+
+    # Maximum number of recordings one client uploads at the same time,
+    # across all of its workflows
+    MAX_UPLOAD_WORKERS = 8
+
+    # Refresh access tokens this many seconds before they expire
+    TOKEN_REFRESH_MARGIN = 60
+
+    # Tokens shared by all clients in the process:
+    # (base_url, api_key) -> (access_token, refresh_token, exp)
+    _TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, Optional[str], Optional[int]]] = {}
+    _TOKEN_LOCK = threading.Lock()
+    # One refresh lock per cache key, so clients sharing a token also
+    # share the guarantee that only one of them refreshes it
+    _REFRESH_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+
     def __init__(self, api_key: str, region: str = 'eus'):
         """
         Initialize the Canary Speech API client.
@@ -46,35 +212,71 @@ class CanarySpeechClient:
 
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        self._exp: Optional[int] = None
+        self._cache_key = (self.base_url, api_key)
+        with self._TOKEN_LOCK:
+            self._refresh_lock = self._REFRESH_LOCKS.setdefault(self._cache_key, threading.Lock())
+
+        # Build URLs and static auth headers once rather than on every call
+        self._urls = {path: f"{self.base_url}/v3/{path}" for path in self.ENDPOINTS}
+        self._api_key_headers = {
+            'Csc-Api-Key': api_key,
+            'Content-Type': 'application/json'
+        }
+
+        # Share one connection pool across calls so each connection pays
+        # the TCP/TLS handshake once instead of once per request. Within a
+        # single workflow the API calls are sequential, so one reused
+        # connection carries them back to back. Concurrent requests (uploads,
+        # or the parallel workflows of BatchCanaryClient) each get their own
+        # pooled HTTP/1.1 connection instead of being multiplexed over
+        # HTTP/2, which requests does not support. The pool is sized so
+        # those connections are kept alive, which means each one pays its
+        # handshake once per client rather than once per request.
+        self.session = requests.Session()
+        self._mount_adapter(DEFAULT_POOL_SIZE)
+
+        # Caps in-flight uploads across every workflow run by this client,
+        # so concurrent workflows cannot overflow the upload host's pool
+        self._upload_slots = threading.BoundedSemaphore(self.MAX_UPLOAD_WORKERS)
+
+    def _mount_adapter(self, pool_size: int) -> None:
+        """Mount the pooled, retrying HTTPS adapter with pool_size connections per host."""
+        self.session.mount('https://', _StreamingHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                                              max_retries=DEFAULT_RETRY))
 
     def authenticate(self) -> bool:
         """
         Authenticate with the API and obtain access tokens.
 
+        Tokens are cached per region and API key for the lifetime of the
+        process, so additional clients reuse a still-valid token instead
+        of requesting a new one.
+
         Returns:
             bool: True if authentication successful, False otherwise
         """
-        url = f"{self.base_url}/v3/auth/tokens/get"
-        headers = {
-            'Csc-Api-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        cached = self._TOKEN_CACHE.get(self._cache_key)
+        # A token without an exp claim is treated as not expiring
+        if cached and (cached[2] is None or time.time() < cached[2] - self.TOKEN_REFRESH_MARGIN):
+            self._set_tokens(*cached)
+            print(f"✓ Using cached access token")
+            print(f"  Token expires: {self._expiry_text()}")
+            return True
+
+        url = self._urls['auth/tokens/get']
 
         try:
-            response = requests.post(url, headers=headers)
+            response = self.session.post(url, headers=self._api_key_headers, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
-            self.access_token = data.get('accessToken')
-            self.refresh_token = data.get('refreshToken')
+            data = _parse_json(response)
+            access_token = data.get('accessToken')
 
-            if self.access_token:
-                # Decode JWT to get expiration
-                decoded = jwt.decode(self.access_token, options={"verify_signature": False})
-                exp_timestamp = decoded.get('exp', 0)
-                exp_datetime = datetime.fromtimestamp(exp_timestamp)
+            if access_token:
+                self._store_tokens(access_token, data.get('refreshToken'))
                 print(f"✓ Authentication successful")
-                print(f"  Token expires: {exp_datetime}")
+                print(f"  Token expires: {self._expiry_text()}")
                 return True
             else:
                 print("✗ Authentication failed: No access token received")
@@ -86,6 +288,120 @@ class CanarySpeechClient:
                 print(f"  Response: {e.response.text}")
             return False
 
+    def refresh(self) -> bool:
+        """
+        Exchange the refresh token for a new access token.
+
+        Falls back to a full authentication when no refresh token is
+        available or the refresh is rejected.
+
+        Returns:
+            bool: True if a valid access token was obtained, False otherwise
+        """
+        if not self.refresh_token:
+            return self.authenticate()
+
+        url = self._urls['auth/tokens/refresh']
+        payload = {'refreshToken': self.refresh_token}
+
+        try:
+            response = self.session.post(url, headers=self._api_key_headers, data=_json_dumps(payload),
+                                         timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()
+
+            data = _parse_json(response)
+            access_token = data.get('accessToken')
+            if not access_token:
+                raise requests.exceptions.RequestException("No access token received")
+            self._store_tokens(access_token, data.get('refreshToken', self.refresh_token))
+            return True
+
+        except requests.exceptions.RequestException as e:
+            print(f"⚠ Token refresh failed ({e}), re-authenticating...")
+            self._invalidate_tokens()
+            return self.authenticate()
+
+    def _store_tokens(self, access_token: str, refresh_token: Optional[str]) -> None:
+        """Decode the token expiry, then cache and apply the new tokens."""
+        # Imported here since only fresh tokens need decoding; this keeps
+        # PyJWT off the CLI's startup path
+        import jwt
+
+        decoded = jwt.decode(access_token, options={"verify_signature": False})
+        tokens = (access_token, refresh_token, decoded.get('exp'))
+        with self._TOKEN_LOCK:
+            self._TOKEN_CACHE[self._cache_key] = tokens
+        self._set_tokens(*tokens)
+
+    def _set_tokens(self, access_token: str, refresh_token: Optional[str], exp: Optional[int]) -> None:
+        """Apply tokens to this client and its session."""
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self._exp = exp
+        self.session.headers.update(self._get_headers())
+
+    def _expiry_text(self) -> str:
+        """Describe when the access token expires."""
+        return str(datetime.fromtimestamp(self._exp)) if self._exp is not None else "unknown (no exp claim)"
+
+    def _invalidate_tokens(self) -> None:
+        """Drop this client's token from the cache so the next authentication hits the API."""
+        with self._TOKEN_LOCK:
+            # Keep the entry if another client has already replaced the token
+            cached = self._TOKEN_CACHE.get(self._cache_key)
+            if cached and cached[0] == self.access_token:
+                del self._TOKEN_CACHE[self._cache_key]
+        self._exp = None
+
+    def _adopt_cached_token(self) -> bool:
+        """
+        Switch to the cached token if another client has refreshed it.
+
+        Returns:
+            bool: True if a newer token was taken from the cache
+        """
+        cached = self._TOKEN_CACHE.get(self._cache_key)
+        if not cached or cached[0] == self.access_token:
+            return False
+        if cached[2] is not None and (self._exp is None or cached[2] <= self._exp):
+            return False
+        self._set_tokens(*cached)
+        return True
+
+    def _token_expiring(self) -> bool:
+        """Check whether the access token is within the refresh margin of expiry."""
+        return self._exp is not None and time.time() > self._exp - self.TOKEN_REFRESH_MARGIN
+
+    def _ensure_token(self) -> None:
+        """Refresh the access token if it is about to expire."""
+        if self._token_expiring():
+            # Only one client or thread refreshes; the others reuse its new token
+            with self._refresh_lock:
+                self._adopt_cached_token()
+                if self._token_expiring():
+                    self.refresh()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an authenticated API request.
+
+        The token is refreshed ahead of expiry, and a 401 response
+        invalidates it and retries the request once with a fresh token.
+        """
+        self._ensure_token()
+        token = self.access_token
+        response = self.session.request(method, url, timeout=DEFAULT_TIMEOUT, **kwargs)
+        if response.status_code == 401:
+            with self._refresh_lock:
+                # Another thread or client may already have replaced the rejected token
+                refreshed = self.access_token != token or self._adopt_cached_token()
+                if not refreshed:
+                    self._invalidate_tokens()
+                    refreshed = self.refresh()
+            if refreshed:
+                response = self.session.request(method, url, timeout=DEFAULT_TIMEOUT, **kwargs)
+        return response
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers with authentication token."""
         return {
@@ -104,17 +420,17 @@ class CanarySpeechClient:
         Returns:
             str: Subject ID if successful, None otherwise
         """
-        url = f"{self.base_url}/v3/api/create-subject"
+        url = self._urls['api/create-subject']
         payload = {
             'projectId': project_id,
             'name': subject_name
         }
 
         try:
-            response = requests.post(url, headers=self._get_headers(), json=payload)
+            response = self._request('POST', url, data=_json_dumps(payload))
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             subject_id = data.get('id')
             print(f"✓ Subject created: {subject_id}")
             return subject_id
@@ -136,7 +452,7 @@ class CanarySpeechClient:
         Returns:
             Tuple of (assessment_id, upload_urls_dict) if successful, None otherwise
         """
-        url = f"{self.base_url}/v3/api/assessment/begin"
+        url = self._urls['api/assessment/begin']
         payload = {
             'surveyCode': survey_code,
             'subjectId': subject_id,
@@ -144,10 +460,10 @@ class CanarySpeechClient:
         }
 
         try:
-            response = requests.post(url, headers=self._get_headers(), json=payload)
+            response = self._request('POST', url, data=_json_dumps(payload))
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             assessment_id = data.get('id')
             upload_urls = data.get('uploadUrls', {})
 
@@ -175,12 +491,24 @@ class CanarySpeechClient:
         Returns:
             bool: True if valid (or unable to validate), False if clearly invalid
         """
-        file_path = Path(audio_file_path)
-
-        # Check file exists
-        if not file_path.exists():
+        try:
+            with open(audio_file_path, 'rb') as audio_file:
+                return self._validate_audio_handle(audio_file_path, audio_file)
+        except FileNotFoundError:
             print(f"✗ Audio file not found: {audio_file_path}")
             return False
+        except OSError as e:
+            print(f"✗ Unable to open audio file: {e}")
+            return False
+
+    def _validate_audio_handle(self, audio_file_path: str, audio_file: BinaryIO) -> bool:
+        """
+        Validate an already opened audio file.
+
+        The handle is rewound afterwards so the caller can upload from it
+        without opening the file again.
+        """
+        file_path = Path(audio_file_path)
 
         # Check file extension
         extension = file_path.suffix.lower()
@@ -189,65 +517,70 @@ class CanarySpeechClient:
             print(f"  Recommended: .wav (uncompressed)")
             print(f"  Supported: .wav, .mp3, .m4a, .ogg, .flac")
 
-        # Try to read WAV header for validation (optional, requires wave module)
+        # Read the WAV header for validation
         if extension == '.wav':
             try:
-                import wave
-                with wave.open(audio_file_path, 'rb') as wav:
-                    channels = wav.getnchannels()
-                    sample_rate = wav.getframerate()
-                    sample_width = wav.getsampwidth()
-                    duration = wav.getnframes() / float(sample_rate)
-
-                    # Validate per documentation requirements
-                    warnings = []
-                    errors = []
-
-                    # Sample rate check
-                    if sample_rate < 16000:
-                        errors.append(f"Sample rate too low: {sample_rate}Hz (minimum: 16000Hz)")
-                    elif sample_rate < 48000:
-                        warnings.append(f"Sample rate {sample_rate}Hz is acceptable but 48000Hz recommended")
-
-                    # Bit depth check
-                    bit_depth = sample_width * 8
-                    if bit_depth < 16:
-                        errors.append(f"Bit depth too low: {bit_depth}-bit (minimum: 16-bit)")
-                    elif bit_depth > 16:
-                        warnings.append(f"Bit depth {bit_depth}-bit is higher than required 16-bit")
-
-                    # Channel check
-                    if channels > 2:
-                        warnings.append(f"Multi-channel audio ({channels} channels). 1 channel per speaker recommended")
-
-                    # Duration check (40-45 seconds recommended per documentation)
-                    if duration < 20:
-                        warnings.append(f"Audio duration {duration:.1f}s is short (20-45s recommended)")
-                    elif duration < 40:
-                        warnings.append(f"Audio duration {duration:.1f}s is acceptable (40-45s optimal)")
-
-                    # Print validation results
-                    if errors:
-                        print("✗ Audio validation failed:")
-                        for error in errors:
-                            print(f"  • {error}")
-                        return False
-
-                    if warnings:
-                        print("⚠ Audio validation warnings:")
-                        for warning in warnings:
-                            print(f"  • {warning}")
-                    else:
-                        print(f"✓ Audio validation passed:")
-                        print(f"  • Sample rate: {sample_rate}Hz")
-                        print(f"  • Bit depth: {bit_depth}-bit")
-                        print(f"  • Channels: {channels}")
-                        print(f"  • Duration: {duration:.1f}s")
+                channels, sample_rate, sample_width, frames = _parse_wav_header(audio_file)
+
+                # Validate per documentation requirements
+                warnings = []
+                errors = []
+
+                # Sample rate check
+                if sample_rate < 16000:
+                    errors.append(f"Sample rate too low: {sample_rate}Hz (minimum: 16000Hz)")
+                elif sample_rate > self.MAX_SAMPLE_RATE:
+                    errors.append(f"Sample rate too high: {sample_rate}Hz (maximum: {self.MAX_SAMPLE_RATE}Hz)")
+                elif sample_rate < 48000:
+                    warnings.append(f"Sample rate {sample_rate}Hz is acceptable but 48000Hz recommended")
+
+                # Bit depth check
+                bit_depth = sample_width * 8
+                if bit_depth < 16:
+                    errors.append(f"Bit depth too low: {bit_depth}-bit (minimum: 16-bit)")
+                elif bit_depth > 32:
+                    errors.append(f"Bit depth too high: {bit_depth}-bit (maximum: 32-bit)")
+                elif bit_depth > 16:
+                    warnings.append(f"Bit depth {bit_depth}-bit is higher than required 16-bit")
+
+                # Channel check
+                if channels not in (1, 2):
+                    errors.append(f"Unsupported channel count: {channels} (1 channel per speaker, at most 2)")
+
+                # Duration check (40-45 seconds recommended per documentation);
+                # a zero sample rate is already an error above
+                duration = frames / float(sample_rate) if sample_rate > 0 else 0.0
+                if duration > self.MAX_DURATION:
+                    errors.append(f"Audio duration {duration:.1f}s is too long (maximum: {self.MAX_DURATION}s)")
+                elif duration < 20:
+                    warnings.append(f"Audio duration {duration:.1f}s is short (20-45s recommended)")
+                elif duration < 40:
+                    warnings.append(f"Audio duration {duration:.1f}s is acceptable (40-45s optimal)")
+
+                # Print validation results
+                if errors:
+                    print("✗ Audio validation failed:")
+                    for error in errors:
+                        print(f"  • {error}")
+                    return False
+
+                if warnings:
+                    print("⚠ Audio validation warnings:")
+                    for warning in warnings:
+                        print(f"  • {warning}")
+                else:
+                    print(f"✓ Audio validation passed:")
+                    print(f"  • Sample rate: {sample_rate}Hz")
+                    print(f"  • Bit depth: {bit_depth}-bit")
+                    print(f"  • Channels: {channels}")
+                    print(f"  • Duration: {duration:.1f}s")
 
             except Exception as e:
                 # If validation fails, warn but don't block
                 print(f"⚠ Unable to validate WAV file: {e}")
                 print(f"  Proceeding with upload...")
+            finally:
+                audio_file.seek(0)
 
         return True
 
@@ -268,38 +601,86 @@ class CanarySpeechClient:
         Returns:
             bool: True if upload successful, False otherwise
         """
-        # Validate audio file first
-        if not self.validate_audio_file(audio_file_path):
-            return False
-
         file_path = Path(audio_file_path)
 
-        # Per documentation: Content-Type must be audio/wav
-        extension = file_path.suffix.lower()
-
-        if extension == '.wav':
-            # Documentation requires audio/wav for WAV files
-            content_type = 'audio/wav'
-        else:
-            print(f"⚠ Warning: Non-WAV format not be optimal for analysis")
-            print(f"  Recommended: Uncompressed WAV with proper header")
-
         try:
             with open(audio_file_path, 'rb') as audio_file:
-                headers = {'Content-Type': content_type}
-                response = requests.put(upload_url, data=audio_file, headers=headers)
+                # Validate from the same handle that is streamed below
+                if not self._validate_audio_handle(audio_file_path, audio_file):
+                    return False
+
+                # Per documentation: Content-Type must be audio/wav
+                extension = file_path.suffix.lower()
+
+                if extension == '.wav':
+                    # Documentation requires audio/wav for WAV files
+                    content_type = 'audio/wav'
+                else:
+                    content_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+                    print(f"⚠ Warning: Non-WAV format not be optimal for analysis")
+                    print(f"  Recommended: Uncompressed WAV with proper header")
+
+                # requests sets Content-Length from the file size and streams
+                # the handle from disk in UPLOAD_BLOCKSIZE writes (see
+                # _StreamingHTTPAdapter). The pre-signed URL carries its own
+                # credentials, so the API bearer token must not be sent along
+                # with the upload.
+                file_size = os.fstat(audio_file.fileno()).st_size
+                headers = {'Content-Type': content_type, 'Authorization': None}
+                with self._upload_slots:
+                    response = self.session.put(upload_url, data=audio_file, headers=headers,
+                                                timeout=DEFAULT_TIMEOUT)
                 response.raise_for_status()
 
-            file_size = file_path.stat().st_size / 1024  # KB
-            print(f"✓ Audio uploaded successfully ({file_size:.1f} KB)")
+            print(f"✓ Audio uploaded successfully ({file_size / 1024:.1f} KB)")
             return True
 
+        except FileNotFoundError:
+            print(f"✗ Audio file not found: {audio_file_path}")
+            return False
+
         except requests.exceptions.RequestException as e:
             print(f"✗ Error uploading audio: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"  Response: {e.response.text}")
             return False
 
+        # After RequestException, which is itself an OSError subclass
+        except OSError as e:
+            print(f"✗ Unable to open audio file: {e}")
+            return False
+
+    def upload_recordings(self, upload_urls: Dict[str, str], audio_files: Dict[str, str]) -> bool:
+        """
+        Upload several recordings concurrently.
+
+        At most MAX_UPLOAD_WORKERS uploads run at once to avoid flooding
+        the pre-signed URL backend.
+
+        Args:
+            upload_urls: Upload URLs by response code, from begin_assessment
+            audio_files: Paths to the audio files by response code
+
+        Returns:
+            bool: True if every upload succeeded, False otherwise
+        """
+        if not audio_files:
+            print("✗ No audio files to upload")
+            return False
+
+        missing = [code for code in audio_files if code not in upload_urls]
+        if missing:
+            print(f"✗ No upload URL for response code(s): {missing}")
+            return False
+
+        uploads = [(upload_urls[code], path) for code, path in audio_files.items()]
+        if len(uploads) == 1:
+            return self.upload_recording(*uploads[0])
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_UPLOAD_WORKERS, len(uploads))) as executor:
+            results = list(executor.map(lambda upload: self.upload_recording(*upload), uploads))
+        return all(results)
+
     def end_assessment(self, assessment_id: str) -> bool:
         """
         End an assessment and trigger scoring.
@@ -311,8 +692,8 @@ class CanarySpeechClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
-        url = f"{self.base_url}/v3/api/assessment/end"
+        timestamp = _utc_timestamp()
+        url = self._urls['api/assessment/end']
         payload = {
             'assessmentId': assessment_id,
             'responseData': [
@@ -329,7 +710,7 @@ class CanarySpeechClient:
 
 
         try:
-            response = requests.post(url, headers=self._get_headers(), json=payload)
+            response = self._request('POST', url, data=_json_dumps(payload))
             response.raise_for_status()
 
             print(f"✓ Assessment ended: {assessment_id}")
@@ -342,54 +723,94 @@ class CanarySpeechClient:
                 print(f"  Response: {e.response.text}")
             return False
 
-    def poll_assessment(self, assessment_id: str, max_attempts: int = 150,
-                        poll_interval: int = 2) -> bool:
+    def poll_assessment(self, assessment_id: str, max_wait: float = 300,
+                        initial_interval: float = 1, max_interval: float = 10,
+                        done: Optional[threading.Event] = None) -> bool:
         """
         Poll the assessment until scores are ready.
 
+        The delay between polls doubles every second attempt (1, 1, 2, 2, 4, ...
+        seconds by default) up to max_interval. A Retry-After header on the
+        poll response takes precedence over the backoff schedule.
+
+        Callers that are notified of completion out of band (for example by
+        a webhook handler in their own service) can pass an event and set it
+        when the notification arrives. The pending wait is then cut short and
+        the assessment is polled immediately to confirm.
+
         Args:
             assessment_id: The assessment ID to poll
-            max_attempts: Maximum number of polling attempts (default 150 = 5 minutes)
-            poll_interval: Seconds between polls (default 2, per documentation)
+            max_wait: Maximum seconds to wait for scores (default 300 = 5 minutes)
+            initial_interval: Seconds before the first re-poll (default 1)
+            max_interval: Upper bound on seconds between polls (default 10)
+            done: Optional event set by the caller once scoring has finished
 
         Returns:
             bool: True if scores are ready, False if timeout
         """
-        url = f"{self.base_url}/v3/api/assessment/poll"
+        url = self._urls['api/assessment/poll']
         params = {'assessmentId': assessment_id}
 
-        print(f"⏳ Polling for scores (max {max_attempts * poll_interval}s)...")
+        print(f"⏳ Polling for scores (max {max_wait:.0f}s)...")
 
-        for attempt in range(1, max_attempts + 1):
+        start = time.monotonic()
+        next_progress = 20  # Print progress every 20 seconds
+        attempt = 0
+        while True:
             try:
-                response = requests.get(url, headers=self._get_headers(), params=params)
+                response = self._request('GET', url, params=params)
                 response.raise_for_status()
 
-                data = response.json()
+                data = _parse_json(response)
                 status = data.get('status', 'unknown')
 
+                elapsed = time.monotonic() - start
                 if status == 'completed':
-                    print(f"✓ Scores ready (after {attempt * poll_interval}s)")
+                    print(f"✓ Scores ready (after {elapsed:.0f}s)")
                     return True
                 elif status == 'failed':
                     print(f"✗ Assessment failed")
                     return False
                 elif status in ['processing', 'pending']:
-                    if attempt % 10 == 0:  # Print progress every 20 seconds
-                        print(f"  Still processing... ({attempt * poll_interval}s elapsed)")
-                    time.sleep(poll_interval)
+                    if elapsed >= next_progress:
+                        print(f"  Still processing... ({elapsed:.0f}s elapsed)")
+                        next_progress += 20
                 else:
                     print(f"  Unknown status: {status}")
-                    time.sleep(poll_interval)
 
             except requests.exceptions.RequestException as e:
                 print(f"✗ Polling error: {e}")
                 return False
 
-        print(f"✗ Timeout: Scores not ready after {max_attempts * poll_interval}s")
+            remaining = max_wait - elapsed
+            if remaining <= 0:
+                break
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = min(max_interval, initial_interval * 2 ** min(attempt // 2, 6))
+            # Once the event has fired, fall back to plain backoff so a
+            # notification that arrives early does not turn into a busy loop
+            if done is not None and not done.is_set():
+                done.wait(min(delay, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+            attempt += 1
+
+        print(f"✗ Timeout: Scores not ready after {max_wait:.0f}s")
         return False
 
-    def get_scores(self, assessment_id: str) -> Optional[Dict]:
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Return the Retry-After delay in seconds, if the server sent one."""
+        value = response.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def get_scores(self, assessment_id: str) -> Optional[Tuple[Dict, bytes]]:
         """
         Retrieve the scores for a completed assessment.
 
@@ -397,18 +818,18 @@ class CanarySpeechClient:
             assessment_id: The assessment ID
 
         Returns:
-            dict: Score data if successful, None otherwise
+            Tuple of (score_data, raw_response_body) if successful, None otherwise
         """
-        url = f"{self.base_url}/v3/api/list-scores"
+        url = self._urls['api/list-scores']
         params = {'assessmentId': assessment_id}
 
         try:
-            response = requests.get(url, headers=self._get_headers(), params=params)
+            response = self._request('GET', url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             print("✓ Scores retrieved successfully")
-            return data
+            return data, response.content
 
         except requests.exceptions.RequestException as e:
             print(f"✗ Error retrieving scores: {e}")
@@ -416,13 +837,187 @@ class CanarySpeechClient:
                 print(f"  Response: {e.response.text}")
             return None
 
+    def run_workflow(self, project_id: str, survey_code: str, subject_name: str,
+                     audio_files: List[str],
+                     response_codes: Optional[List[str]] = None,
+                     done: Optional[threading.Event] = None) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Run the typical workflow from subject creation to score retrieval.
+
+        Each audio file is paired with the response code at the same position
+        in response_codes, or with the available upload URLs in order when no
+        codes are given. When more than one recording is uploaded, the uploads
+        run concurrently since they target independent URLs.
+
+        Args:
+            project_id: The project ID provided by Canary Speech
+            survey_code: The survey code provided by Canary Speech
+            subject_name: The name of the subject
+            audio_files: Paths to the audio files to upload
+            response_codes: Optional response codes, one per audio file
+            done: Optional completion event, see poll_assessment
+
+        Returns:
+            Tuple of (score_data, raw_response_body) as returned by get_scores
+            if successful, None otherwise
+        """
+        # Check the inputs before creating anything on the server
+        if not audio_files:
+            print("✗ At least one audio file is required")
+            return None
+        if response_codes:
+            if len(response_codes) != len(audio_files):
+                print(f"✗ {len(audio_files)} audio file(s) but {len(response_codes)} response code(s)")
+                return None
+            if len(set(response_codes)) != len(response_codes):
+                print(f"✗ Each response code can only be used once: {response_codes}")
+                return None
+
+        # Step 2: Create subject
+        print(f"Step 2: Creating subject '{subject_name}'...")
+        subject_id = self.create_subject(project_id, subject_name)
+        if not subject_id:
+            return None
+        print()
+
+        # Step 3: Begin assessment
+        print("Step 3: Beginning assessment...")
+        result = self.begin_assessment(survey_code, subject_id)
+        if not result:
+            return None
+        assessment_id, upload_urls = result
+        print()
+
+        # Step 4: Upload recordings
+        print("Step 4: Uploading recording...")
+        if not upload_urls:
+            print("✗ No upload URLs available")
+            return None
+
+        # Use specified response codes or the first available ones
+        if response_codes:
+            missing = [code for code in response_codes if code not in upload_urls]
+            if missing:
+                print(f"✗ Response code(s) not found: {missing}")
+                print(f"  Available: {list(upload_urls.keys())}")
+                return None
+        else:
+            response_codes = list(upload_urls.keys())[:len(audio_files)]
+            print(f"  Using response code(s): {', '.join(response_codes)}")
+            if len(response_codes) != len(audio_files):
+                print(f"✗ {len(audio_files)} audio file(s) but only {len(response_codes)} upload URL(s)")
+                return None
+
+        if not self.upload_recordings(upload_urls, dict(zip(response_codes, audio_files))):
+            return None
+        print()
+
+        # Step 5: End assessment
+        print("Step 5: Ending assessment...")
+        if not self.end_assessment(assessment_id):
+            return None
+        print()
+
+        # Step 6: Poll for completion
+        print("Step 6: Waiting for scores...")
+        if not self.poll_assessment(assessment_id, done=done):
+            return None
+        print()
+
+        # Step 7: Retrieve scores
+        print("Step 7: Retrieving scores...")
+        return self.get_scores(assessment_id)
+
+
+class BatchJob(NamedTuple):
+    """One subject's recordings for BatchCanaryClient.batch_run."""
+    subject_name: str
+    audio_files: List[str]
+    response_codes: Optional[List[str]] = None
 
-def display_scores(scores: Dict) -> None:
+
+class BatchCanaryClient(CanarySpeechClient):
+    """
+    Client that runs the workflow for many subjects concurrently.
+
+    Each job runs the full workflow from run_workflow, with up to
+    max_concurrency jobs in flight. While one job waits on scoring,
+    others create subjects, upload and poll, so a batch takes roughly
+    the time of its slowest jobs rather than the sum of all of them.
+    All jobs share this client's session and access token, and at most
+    MAX_UPLOAD_WORKERS uploads run at once across the whole batch.
+    """
+
+    # Default number of jobs in flight at once
+    MAX_CONCURRENT_JOBS = 8
+
+    def __init__(self, api_key: str, region: str = 'eus',
+                 max_concurrency: int = MAX_CONCURRENT_JOBS):
+        """
+        Initialize the batch client.
+
+        Args:
+            api_key: API key in format "CLIENT_ID:SECRET"
+            region: Region code ('eus', 'ne', or 'jpe')
+            max_concurrency: Maximum number of jobs run at the same time
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        super().__init__(api_key, region)
+        self.max_concurrency = max_concurrency
+
+        # Every job may have an API request in flight at once; keep one
+        # pooled connection per job so none are discarded after use
+        if max_concurrency > DEFAULT_POOL_SIZE:
+            self._mount_adapter(max_concurrency)
+
+    def batch_run(self, project_id: str, survey_code: str,
+                  jobs: List[BatchJob]) -> List[Optional[Tuple[Dict, bytes]]]:
+        """
+        Run the workflow for every job.
+
+        The client must already be authenticated. A failed job does not
+        stop the others.
+
+        Args:
+            project_id: The project ID provided by Canary Speech
+            survey_code: The survey code provided by Canary Speech
+            jobs: The subjects and recordings to assess
+
+        Returns:
+            List with the run_workflow result for each job, in job order
+            (None for jobs that failed)
+        """
+        results: List[Optional[Tuple[Dict, bytes]]] = [None] * len(jobs)
+        if not jobs:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(jobs))) as executor:
+            futures = {
+                executor.submit(self.run_workflow, project_id, survey_code, job.subject_name,
+                                job.audio_files, job.response_codes): index
+                for index, job in enumerate(jobs)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"✗ Job '{jobs[index].subject_name}' failed: {e}")
+                status = "✓" if results[index] else "✗"
+                print(f"{status} Job {completed}/{len(jobs)} finished: {jobs[index].subject_name}")
+
+        return results
+
+
+def display_scores(scores: Dict, raw: Optional[bytes] = None, verbose: bool = False) -> None:
     """
     Display assessment scores in a readable format.
 
     Args:
         scores: Score data from the API
+        raw: Raw response body the scores were parsed from, if available
+        verbose: Also print the full JSON response
     """
     print("\n" + "="*60)
     print("ASSESSMENT SCORES")
@@ -431,8 +1026,8 @@ def display_scores(scores: Dict) -> None:
     # Display assessment metadata
     if 'assessmentId' in scores:
         print(f"\nAssessment ID: {scores['assessmentId']}")
-    if 'subject_id' in scores:
-        print(f"Subject ID: {scores['subjectIid']}")
+    if 'subjectId' in scores:
+        print(f"Subject ID: {scores['subjectId']}")
 
     # Display scores
     if 'scores' in scores:
@@ -443,15 +1038,19 @@ def display_scores(scores: Dict) -> None:
             print(f"\n  {score_type}:")
             print(f"    Result: {value}")
 
-    # Display full JSON for reference
-    print("\n" + "-"*60)
-    print("Full Response (JSON):")
-    print("-"*60)
-    print(json.dumps(scores, indent=2))
+    # Display full JSON for reference; the raw body is printed as received
+    # rather than re-serializing the parsed scores
+    if verbose:
+        print("\n" + "-"*60)
+        print("Full Response (JSON):")
+        print("-"*60)
+        print(raw.decode() if raw is not None else _json_dumps(scores, indent=True).decode())
     print("="*60 + "\n")
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Canary Speech API Client - Submit audio for vocal analysis',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -467,8 +1066,8 @@ Environment variables (alternative to command-line args):
         """
     )
 
-    parser.add_argument('--audio-file', required=True,
-                        help='Path to audio file (WAV file)')
+    parser.add_argument('--audio-file', required=True, action='append',
+                        help='Path to audio file (WAV file); repeat for multiple recordings')
     parser.add_argument('--api-key',
                         help='API key (or set CANARY_API_KEY env var)')
     parser.add_argument('--project-id',
@@ -479,8 +1078,11 @@ Environment variables (alternative to command-line args):
                         help='Name used to create a subject')
     parser.add_argument('--region', default='eus', choices=['eus', 'ne', 'jpe'],
                         help='API region (default: eus)')
-    parser.add_argument('--response-code',
-                        help='Response code for the recording (default: first available)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print the full JSON score response')
+    parser.add_argument('--response-code', action='append',
+                        help='Response code for the recording; repeat once per audio file '
+                             '(default: first available)')
 
     args = parser.parse_args()
 
@@ -503,7 +1105,7 @@ Environment variables (alternative to command-line args):
 
     print("Canary Speech API Client")
     print("="*60)
-    print(f"Audio file: {args.audio_file}")
+    print(f"Audio file: {', '.join(args.audio_file)}")
     print(f"Region: {region}")
     print("="*60 + "\n")
 
@@ -516,66 +1118,17 @@ Environment variables (alternative to command-line args):
         sys.exit(1)
     print()
 
-    # Step 2: Create or use subject
+    # Steps 2-7: Run the workflow
     subject_name = args.subject_name
     if not subject_name:
         print("✗ Error: Subject name required to create a new subject")
         sys.exit(1)
-    print(f"Step 2: Creating subject '{subject_name}'...")
-    subject_id = client.create_subject(project_id, subject_name)
-    if not subject_id:
-        sys.exit(1)
-    print()
-
-    # Step 3: Begin assessment
-    print("Step 3: Beginning assessment...")
-    result = client.begin_assessment(survey_code, subject_id)
+    result = client.run_workflow(project_id, survey_code, subject_name,
+                                 args.audio_file, args.response_code)
     if not result:
         sys.exit(1)
-    assessment_id, upload_urls = result
-    print()
-
-    # Step 4: Upload recording
-    print("Step 4: Uploading recording...")
-    if not upload_urls:
-        print("✗ No upload URLs available")
-        sys.exit(1)
-
-    # Use specified response code or first available
-    response_code = args.response_code
-    if response_code and response_code not in upload_urls:
-        print(f"✗ Response code '{response_code}' not found")
-        print(f"  Available: {list(upload_urls.keys())}")
-        sys.exit(1)
-
-    if not response_code:
-        response_code = list(upload_urls.keys())[0]
-        print(f"  Using response code: {response_code}")
-
-    upload_url = upload_urls[response_code]
-    if not client.upload_recording(upload_url, args.audio_file):
-        sys.exit(1)
-    print()
-
-    # Step 5: End assessment
-    print("Step 5: Ending assessment...")
-    if not client.end_assessment(assessment_id):
-        sys.exit(1)
-    print()
-
-    # Step 6: Poll for completion
-    print("Step 6: Waiting for scores...")
-    if not client.poll_assessment(assessment_id):
-        sys.exit(1)
-    print()
-
-    # Step 7: Retrieve and display scores
-    print("Step 7: Retrieving scores...")
-    scores = client.get_scores(assessment_id)
-    if scores:
-        display_scores(scores)
-    else:
-        sys.exit(1)
+    scores, raw = result
+    display_scores(scores, raw, verbose=args.verbose)
 
     print("✓ Workflow completed successfully!")
 
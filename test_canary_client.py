@@ -1,18 +1,102 @@
+import io
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import patch, MagicMock
-from canary_speech_client import CanarySpeechClient
+import requests
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import call, patch, MagicMock
+from canary_speech_client import (BatchCanaryClient, BatchJob, CanarySpeechClient, _parse_wav_header,
+                                  display_scores)
+
+WAV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sameple.wav")
+
+
+def wav_header(channels=1, sample_rate=16000, sample_width=2, frames=16000 * 45, extra=b""):
+    """Build a PCM WAV header (without sample data) for the given format."""
+    block_align = channels * sample_width
+    fmt = struct.pack("<HHIIHH", 1, channels, sample_rate, sample_rate * block_align,
+                      block_align, sample_width * 8)
+    data_size = frames * block_align
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + extra + (b"\x00" if len(extra) % 2 else b"")
+    body += b"data" + struct.pack("<I", data_size)
+    return b"RIFF" + struct.pack("<I", len(body) + data_size) + body
+
+
+def fake_urllib3_response(status, body=b"", retry_after=True):
+    """Build a urllib3 response as returned by the connection pool."""
+    headers = {"Content-Length": str(len(body))}
+    if retry_after:
+        headers["Retry-After"] = "0"
+    return urllib3.HTTPResponse(body=io.BytesIO(body), status=status, preload_content=False, headers=headers)
+
 
 class TestCanarySpeechClient(unittest.TestCase):
     def setUp(self):
+        CanarySpeechClient._TOKEN_CACHE.clear()
         self.client = CanarySpeechClient(api_key="test_id:test_secret", region="eus")
 
-    @patch("requests.post")
+    def test_session_retries_transient_errors(self):
+        retries = self.client.session.get_adapter("https://rest.eus.canaryspeech.com").max_retries
+        self.assertEqual(retries.total, 3)
+        self.assertIn(503, retries.status_forcelist)
+        self.assertIn("POST", retries.allowed_methods)
+        self.assertEqual(retries.read, 0)
+
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_retries_503_then_succeeds(self, mock_make_request):
+        response = fake_urllib3_response
+
+        mock_make_request.side_effect = [response(503), response(200, b'{"id": "subject123"}')]
+        self.client.access_token = "token"
+        self.assertEqual(self.client.create_subject("proj", "name"), "subject123")
+        self.assertEqual(mock_make_request.call_count, 2)
+
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_does_not_resend_post_after_gateway_error(self, mock_make_request):
+        for status in (500, 502, 504):
+            mock_make_request.reset_mock()
+            mock_make_request.side_effect = [fake_urllib3_response(status, retry_after=False),
+                                             fake_urllib3_response(200, b'{"id": "subject123"}')]
+            self.client.access_token = "token"
+            self.assertIsNone(self.client.create_subject("proj", "name"))
+            self.assertEqual(mock_make_request.call_count, 1)
+
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_does_not_resend_post_on_503_without_retry_after(self, mock_make_request):
+        mock_make_request.side_effect = [fake_urllib3_response(503, retry_after=False),
+                                         fake_urllib3_response(200, b'{"id": "subject123"}')]
+        self.client.access_token = "token"
+        self.assertIsNone(self.client.create_subject("proj", "name"))
+        self.assertEqual(mock_make_request.call_count, 1)
+
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_retries_get_on_gateway_error(self, mock_make_request):
+        mock_make_request.side_effect = [fake_urllib3_response(502, retry_after=False),
+                                         fake_urllib3_response(200, b'{"scores": []}')]
+        self.client.access_token = "token"
+        scores, _ = self.client.get_scores("assess_id")
+        self.assertEqual(scores, {"scores": []})
+        self.assertEqual(mock_make_request.call_count, 2)
+
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_does_not_resend_post_after_read_timeout(self, mock_make_request):
+        mock_make_request.side_effect = urllib3.exceptions.ReadTimeoutError(None, "url", "read timed out")
+        self.client.access_token = "token"
+        self.assertIsNone(self.client.create_subject("proj", "name"))
+        self.assertEqual(mock_make_request.call_count, 1)
+
+    @patch("requests.Session.post")
     def test_authenticate_success(self, mock_post):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "accessToken": "fake.jwt.token",
             "refreshToken": "refresh"
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
@@ -20,11 +104,12 @@ class TestCanarySpeechClient(unittest.TestCase):
             result = self.client.authenticate()
             self.assertTrue(result)
             self.assertEqual(self.client.access_token, "fake.jwt.token")
+            self.assertEqual(self.client.session.headers["Authorization"], "Bearer fake.jwt.token")
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
     def test_create_subject_success(self, mock_post):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "subject123"}
+        mock_response.content = json.dumps({"id": "subject123"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
@@ -32,10 +117,10 @@ class TestCanarySpeechClient(unittest.TestCase):
         subject_id = self.client.create_subject("proj", "name")
         self.assertEqual(subject_id, "subject123")
 
-    @patch("requests.post")
+    @patch("requests.Session.request")
     def test_begin_assessment_success(self, mock_post):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "assess123", "uploadUrls": {"code": "url"}}
+        mock_response.content = json.dumps({"id": "assess123", "uploadUrls": {"code": "url"}}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
@@ -44,60 +129,384 @@ class TestCanarySpeechClient(unittest.TestCase):
         self.assertEqual(result[0], "assess123")
         self.assertIn("code", result[1])
 
-    @patch("canary_speech_client.Path.exists", return_value=True)
+    @patch("builtins.open", new_callable=MagicMock)
     @patch("canary_speech_client.Path.suffix", new_callable=MagicMock(return_value=".wav"))
-    @patch("wave.open")
-    def test_validate_audio_file_wav(self, mock_wave_open, mock_suffix, mock_exists):
-        mock_wave = MagicMock()
-        mock_wave.getnchannels.return_value = 1
-        mock_wave.getframerate.return_value = 16000
-        mock_wave.getsampwidth.return_value = 2
-        mock_wave.getnframes.return_value = 320000
-        mock_wave_open.return_value.__enter__.return_value = mock_wave
+    def test_validate_audio_file_wav(self, mock_suffix, mock_open):
+        mock_open.return_value = io.BytesIO(wav_header(channels=1, sample_rate=16000, sample_width=2, frames=320000))
 
         result = self.client.validate_audio_file("sample.wav")
         self.assertTrue(result)
 
-    @patch("requests.put")
-    @patch("canary_speech_client.Path.exists", return_value=True)
+    @patch("builtins.open")
+    def test_validate_audio_file_rejects_out_of_range_header(self, mock_open):
+        mock_open.return_value = io.BytesIO(wav_header(sample_rate=100_000_000, frames=0))
+        self.assertFalse(self.client.validate_audio_file("sample.wav"))
+
+        mock_open.return_value = io.BytesIO(wav_header(channels=6))
+        self.assertFalse(self.client.validate_audio_file("sample.wav"))
+
+        mock_open.return_value = io.BytesIO(wav_header(frames=16000 * 601))
+        self.assertFalse(self.client.validate_audio_file("sample.wav"))
+
+    def test_parse_wav_header_skips_extra_chunks(self):
+        header = wav_header(channels=2, sample_rate=48000, sample_width=3, frames=1000, extra=b"LIST\x03\x00\x00\x00abc")
+        self.assertEqual(_parse_wav_header(io.BytesIO(header)), (2, 48000, 3, 1000))
+
+    def test_parse_wav_header_rejects_non_wav(self):
+        with self.assertRaises(ValueError):
+            _parse_wav_header(io.BytesIO(b"ID3\x04" + b"\x00" * 40))
+        with self.assertRaisesRegex(ValueError, "fmt chunk truncated"):
+            _parse_wav_header(io.BytesIO(wav_header()[:30]))
+
+    @patch("requests.Session.put")
     @patch("canary_speech_client.Path.suffix", new_callable=MagicMock(return_value=".wav"))
     @patch("builtins.open", new_callable=MagicMock)
-    def test_upload_recording_success(self, mock_put, mock_suffix, mock_exists, mock_open):
+    def test_upload_recording_success(self, mock_open, mock_suffix, mock_put):
         self.client.access_token = "token"
         mock_put.return_value.raise_for_status.return_value = None
-        with patch.object(self.client, "validate_audio_file", return_value=True):
-            with patch("canary_speech_client.Path.stat", return_value=MagicMock(st_size=1024)):
+        with patch.object(self.client, "_validate_audio_handle", return_value=True):
+            with patch("canary_speech_client.os.fstat", return_value=MagicMock(st_size=1024)):
                 result = self.client.upload_recording("url", "file.wav")
                 self.assertTrue(result)
 
-    @patch("requests.post")
+    @patch("requests.Session.put")
+    def test_upload_recording_headers(self, mock_put):
+        with patch.object(self.client, "_validate_audio_handle", return_value=True), \
+                patch("builtins.open", new_callable=MagicMock), \
+                patch("canary_speech_client.os.fstat", return_value=MagicMock(st_size=2048)):
+            self.assertTrue(self.client.upload_recording("url", "file.wav"))
+        headers = mock_put.call_args.kwargs["headers"]
+        self.assertEqual(headers["Content-Type"], "audio/wav")
+        self.assertIsNone(headers["Authorization"])
+
+    def test_unopenable_audio_file(self):
+        with tempfile.TemporaryDirectory(suffix=".wav") as directory:
+            self.assertFalse(self.client.validate_audio_file(directory))
+            self.assertFalse(self.client.upload_recording("url", directory))
+
+    @patch("requests.Session.put", side_effect=requests.exceptions.ConnectionError("refused"))
+    def test_upload_recording_connection_error(self, mock_put):
+        self.assertFalse(self.client.upload_recording("url", WAV_PATH))
+
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    def test_upload_recording_missing_file(self, mock_open):
+        self.assertFalse(self.client.upload_recording("url", "missing.wav"))
+
+    @patch("requests.Session.request")
     def test_end_assessment_success(self, mock_post):
         mock_post.return_value.raise_for_status.return_value = None
         self.client.access_token = "token"
         result = self.client.end_assessment("assess_id")
         self.assertTrue(result)
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_poll_assessment_completed(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "completed"}
+        mock_response.content = json.dumps({"status": "completed"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         self.client.access_token = "token"
-        result = self.client.poll_assessment("assess_id", max_attempts=1, poll_interval=0)
+        result = self.client.poll_assessment("assess_id", max_wait=0)
         self.assertTrue(result)
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
+    def test_end_assessment_sends_utc_timestamp(self, mock_post):
+        self.client.access_token = "token"
+        with patch("canary_speech_client.time.time_ns", return_value=1_700_000_000_123_456_789):
+            self.client.end_assessment("assess_id")
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(payload["responseData"][0]["timestamp"], "2023-11-14T22:13:20.123Z")
+
+    @patch("canary_speech_client.time.sleep")
+    @patch("requests.Session.request")
+    def test_poll_assessment_backs_off(self, mock_get, mock_sleep):
+        pending = MagicMock(headers={})
+        pending.content = json.dumps({"status": "processing"}).encode()
+        completed = MagicMock(headers={})
+        completed.content = json.dumps({"status": "completed"}).encode()
+        mock_get.side_effect = [pending] * 5 + [completed]
+
+        self.client.access_token = "token"
+        self.assertTrue(self.client.poll_assessment("assess_id", max_interval=3))
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1, 1, 2, 2, 3])
+
+    @patch("canary_speech_client.time.sleep")
+    @patch("requests.Session.request")
+    def test_poll_assessment_honors_retry_after(self, mock_get, mock_sleep):
+        pending = MagicMock(headers={"Retry-After": "5"})
+        pending.content = json.dumps({"status": "pending"}).encode()
+        completed = MagicMock(headers={})
+        completed.content = json.dumps({"status": "completed"}).encode()
+        mock_get.side_effect = [pending, completed]
+
+        self.client.access_token = "token"
+        self.assertTrue(self.client.poll_assessment("assess_id"))
+        mock_sleep.assert_called_once_with(5.0)
+
+    @patch("canary_speech_client.time.sleep")
+    @patch("requests.Session.request")
+    def test_poll_assessment_wakes_on_event(self, mock_get, mock_sleep):
+        pending = MagicMock(headers={})
+        pending.content = json.dumps({"status": "processing"}).encode()
+        completed = MagicMock(headers={})
+        completed.content = json.dumps({"status": "completed"}).encode()
+        mock_get.side_effect = [pending, completed]
+        done = threading.Event()
+        threading.Timer(0.05, done.set).start()
+
+        self.client.access_token = "token"
+        self.assertTrue(self.client.poll_assessment("assess_id", initial_interval=30, done=done))
+        mock_sleep.assert_not_called()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.request")
     def test_get_scores_success(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"scores": []}
+        mock_response.content = json.dumps({"scores": []}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         self.client.access_token = "token"
-        scores = self.client.get_scores("assess_id")
+        scores, raw = self.client.get_scores("assess_id")
         self.assertIsInstance(scores, dict)
+        self.assertEqual(raw, b'{"scores": []}')
+
+    @patch("requests.Session.request")
+    def test_get_scores_invalid_json(self, mock_get):
+        mock_get.return_value.content = b"<html>Bad Gateway</html>"
+
+        self.client.access_token = "token"
+        self.assertIsNone(self.client.get_scores("assess_id"))
+
+    @patch("requests.Session.post")
+    def test_authenticate_reuses_cached_token(self, mock_post):
+        mock_post.return_value.content = json.dumps({"accessToken": "fake.jwt.token", "refreshToken": "refresh"}).encode()
+        with patch("jwt.decode", return_value={"exp": 9999999999}):
+            self.assertTrue(self.client.authenticate())
+            other = CanarySpeechClient(api_key="test_id:test_secret", region="eus")
+            self.assertTrue(other.authenticate())
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(other.access_token, "fake.jwt.token")
+
+    @patch("requests.Session.request")
+    @patch("requests.Session.post")
+    def test_token_without_exp_is_not_refreshed(self, mock_post, mock_request):
+        mock_post.return_value.content = json.dumps({"accessToken": "fake.jwt.token", "refreshToken": "refresh"}).encode()
+        mock_request.return_value.content = json.dumps({"id": "subject123"}).encode()
+        with patch("jwt.decode", return_value={}):
+            self.assertTrue(self.client.authenticate())
+            self.client.create_subject("proj", "name")
+            other = CanarySpeechClient(api_key="test_id:test_secret", region="eus")
+            self.assertTrue(other.authenticate())
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertIsNone(self.client._exp)
+
+    @patch("requests.Session.request")
+    @patch("requests.Session.post")
+    def test_request_refreshes_expiring_token(self, mock_post, mock_request):
+        mock_post.return_value.content = json.dumps({"accessToken": "new.jwt.token", "refreshToken": "refresh2"}).encode()
+        mock_request.return_value.content = json.dumps({"id": "subject123"}).encode()
+        self.client._set_tokens("old.jwt.token", "refresh", 0)
+        with patch("jwt.decode", return_value={"exp": 9999999999}):
+            self.client.create_subject("proj", "name")
+        self.assertTrue(mock_post.call_args.args[0].endswith("/v3/auth/tokens/refresh"))
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"refreshToken": "refresh"})
+        self.assertEqual(self.client.access_token, "new.jwt.token")
+        self.assertEqual(self.client.refresh_token, "refresh2")
+
+    @patch("requests.Session.request")
+    @patch("requests.Session.post")
+    def test_clients_sharing_a_key_refresh_once(self, mock_post, mock_request):
+        token_responses = {
+            "get": {"accessToken": "tok1", "refreshToken": "r1"},
+            "refresh": {"accessToken": "tok2", "refreshToken": "r2"},
+        }
+        calls = []
+
+        def post(url, **kwargs):
+            endpoint = url.rsplit("/", 1)[-1]
+            calls.append(endpoint)
+            return MagicMock(content=json.dumps(token_responses[endpoint]).encode())
+
+        mock_post.side_effect = post
+        mock_request.return_value.content = json.dumps({"id": "subject123"}).encode()
+        expiry = {"tok1": 1000, "tok2": 5000}
+        other = CanarySpeechClient(api_key="test_id:test_secret", region="eus")
+        with patch("jwt.decode", side_effect=lambda token, **kwargs: {"exp": expiry[token]}):
+            with patch("canary_speech_client.time.time", return_value=0):
+                self.assertTrue(self.client.authenticate())
+                self.assertTrue(other.authenticate())
+            with patch("canary_speech_client.time.time", return_value=990):
+                self.client.create_subject("proj", "name")
+                other.create_subject("proj", "name")
+
+        self.assertEqual(calls, ["get", "refresh"])
+        self.assertEqual(other.access_token, "tok2")
+        self.assertEqual(other.refresh_token, "r2")
+        self.assertIs(self.client._refresh_lock, other._refresh_lock)
+
+    def test_invalidate_keeps_token_replaced_by_another_client(self):
+        other = CanarySpeechClient(api_key="test_id:test_secret", region="eus")
+        other._set_tokens("stale", "r1", 1000)
+        CanarySpeechClient._TOKEN_CACHE[other._cache_key] = ("fresh", "r2", 5000)
+        other._invalidate_tokens()
+        self.assertEqual(CanarySpeechClient._TOKEN_CACHE[other._cache_key][0], "fresh")
+
+    @patch("requests.Session.request")
+    @patch("requests.Session.post")
+    def test_request_retries_once_after_401(self, mock_post, mock_request):
+        unauthorized = MagicMock(status_code=401)
+        ok = MagicMock(status_code=200)
+        ok.content = json.dumps({"id": "subject123"}).encode()
+        mock_request.side_effect = [unauthorized, ok]
+        mock_post.return_value.content = json.dumps({"accessToken": "new.jwt.token", "refreshToken": "refresh2"}).encode()
+        self.client._set_tokens("old.jwt.token", "refresh", 9999999999)
+        with patch("jwt.decode", return_value={"exp": 9999999999}):
+            subject_id = self.client.create_subject("proj", "name")
+        self.assertEqual(subject_id, "subject123")
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.client.session.headers["Authorization"], "Bearer new.jwt.token")
+
+    def test_upload_recordings_bounds_concurrency(self):
+        upload_urls = {f"code_{i}": f"url_{i}" for i in range(20)}
+        audio_files = {code: f"{code}.wav" for code in upload_urls}
+        with patch.object(self.client, "upload_recording", return_value=True) as mock_upload, \
+                patch("canary_speech_client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+            self.assertTrue(self.client.upload_recordings(upload_urls, audio_files))
+        mock_executor.assert_called_once_with(max_workers=CanarySpeechClient.MAX_UPLOAD_WORKERS)
+        self.assertEqual(mock_upload.call_count, 20)
+
+    def test_upload_recordings_reports_failure(self):
+        upload_urls = {"code_a": "url_a", "code_b": "url_b"}
+        audio_files = {"code_a": "a.wav", "code_b": "b.wav"}
+        with patch.object(self.client, "upload_recording", side_effect=[True, False]):
+            self.assertFalse(self.client.upload_recordings(upload_urls, audio_files))
+
+    def test_upload_recordings_rejects_empty_mapping(self):
+        with patch.object(self.client, "upload_recording") as mock_upload:
+            self.assertFalse(self.client.upload_recordings({"code": "url"}, {}))
+        mock_upload.assert_not_called()
+
+    def test_run_workflow_uploads_each_recording(self):
+        upload_urls = {"code_a": "url_a", "code_b": "url_b"}
+        with patch.object(self.client, "create_subject", return_value="subject123"), \
+                patch.object(self.client, "begin_assessment", return_value=("assess123", upload_urls)), \
+                patch.object(self.client, "upload_recording", return_value=True) as mock_upload, \
+                patch.object(self.client, "end_assessment", return_value=True), \
+                patch.object(self.client, "poll_assessment", return_value=True), \
+                patch.object(self.client, "get_scores", return_value=({"scores": []}, b'{"scores":[]}')):
+            result = self.client.run_workflow("proj", "survey", "name", ["a.wav", "b.wav"])
+            self.assertEqual(result, ({"scores": []}, b'{"scores":[]}'))
+            self.assertCountEqual(mock_upload.call_args_list,
+                                  [call("url_a", "a.wav"), call("url_b", "b.wav")])
+
+    def test_run_workflow_rejects_empty_audio_files(self):
+        with patch.object(self.client, "create_subject") as mock_create, \
+                patch.object(self.client, "begin_assessment") as mock_begin:
+            self.assertIsNone(self.client.run_workflow("proj", "survey", "name", []))
+        mock_create.assert_not_called()
+        mock_begin.assert_not_called()
+
+    def test_run_workflow_rejects_mismatched_response_codes(self):
+        for response_codes in (["code_a"], ["code_a", "code_a"]):
+            with patch.object(self.client, "create_subject") as mock_create, \
+                    patch.object(self.client, "begin_assessment") as mock_begin:
+                self.assertIsNone(self.client.run_workflow("proj", "survey", "name", ["a.wav", "b.wav"],
+                                                           response_codes))
+            mock_create.assert_not_called()
+            mock_begin.assert_not_called()
+
+    def test_run_workflow_unknown_response_code(self):
+        with patch.object(self.client, "create_subject", return_value="subject123"), \
+                patch.object(self.client, "begin_assessment", return_value=("assess123", {"code": "url"})), \
+                patch.object(self.client, "upload_recording") as mock_upload:
+            scores = self.client.run_workflow("proj", "survey", "name", ["a.wav"], ["missing"])
+            self.assertIsNone(scores)
+            mock_upload.assert_not_called()
+
+    def test_display_scores_prints_raw_body_only_when_verbose(self):
+        scores = {"assessmentId": "assess123", "scores": []}
+        raw = b'{"assessmentId":"assess123","scores":[]}'
+        with patch("builtins.print") as mock_print:
+            display_scores(scores, raw)
+        self.assertNotIn(call(raw.decode()), mock_print.call_args_list)
+
+        with patch("builtins.print") as mock_print:
+            display_scores(scores, raw, verbose=True)
+        mock_print.assert_any_call(raw.decode())
+
+
+class TestBatchCanaryClient(unittest.TestCase):
+    def setUp(self):
+        CanarySpeechClient._TOKEN_CACHE.clear()
+        self.client = BatchCanaryClient(api_key="test_id:test_secret", region="eus", max_concurrency=2)
+
+    def test_batch_run_returns_results_in_job_order(self):
+        jobs = [BatchJob(f"subject_{i}", [f"{i}.wav"]) for i in range(5)]
+
+        def run_workflow(project_id, survey_code, subject_name, audio_files, response_codes):
+            if subject_name == "subject_3":
+                return None
+            return {"subject": subject_name}, b"{}"
+
+        with patch.object(self.client, "run_workflow", side_effect=run_workflow), \
+                patch("canary_speech_client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+            results = self.client.batch_run("proj", "survey", jobs)
+        mock_executor.assert_called_once_with(max_workers=2)
+        self.assertEqual([r[0]["subject"] if r else None for r in results],
+                         ["subject_0", "subject_1", "subject_2", None, "subject_4"])
+
+    def test_batch_run_isolates_job_errors(self):
+        jobs = [BatchJob("ok", ["a.wav"]), BatchJob("broken", ["b.wav"])]
+
+        def run_workflow(project_id, survey_code, subject_name, audio_files, response_codes):
+            if subject_name == "broken":
+                raise RuntimeError("boom")
+            return {"scores": []}, b"{}"
+
+        with patch.object(self.client, "run_workflow", side_effect=run_workflow):
+            results = self.client.batch_run("proj", "survey", jobs)
+        self.assertEqual(results, [({"scores": []}, b"{}"), None])
+
+    def test_batch_run_caps_uploads_across_jobs(self):
+        self.client = BatchCanaryClient(api_key="test_id:test_secret", region="eus", max_concurrency=4)
+        self.client._upload_slots = threading.BoundedSemaphore(2)
+        in_flight = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def put(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return MagicMock()
+
+        upload_urls = {f"code_{i}": f"url_{i}" for i in range(3)}
+        jobs = [BatchJob(f"subject_{i}", [WAV_PATH] * 3) for i in range(4)]
+        with patch.object(self.client, "create_subject", return_value="subject123"), \
+                patch.object(self.client, "begin_assessment", return_value=("assess123", upload_urls)), \
+                patch.object(self.client, "_validate_audio_handle", return_value=True), \
+                patch.object(self.client.session, "put", side_effect=put) as mock_put, \
+                patch.object(self.client, "end_assessment", return_value=True), \
+                patch.object(self.client, "poll_assessment", return_value=True), \
+                patch.object(self.client, "get_scores", return_value=({"scores": []}, b"{}")):
+            results = self.client.batch_run("proj", "survey", jobs)
+        self.assertTrue(all(results))
+        self.assertEqual(mock_put.call_count, 12)
+        self.assertEqual(peak[0], 2)
+
+    def test_pool_sized_for_concurrency(self):
+        client = BatchCanaryClient(api_key="test_id:test_secret", region="eus", max_concurrency=32)
+        adapter = client.session.get_adapter("https://rest.eus.canaryspeech.com")
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            BatchCanaryClient(api_key="test_id:test_secret", max_concurrency=0)
 
 if __name__ == "__main__":
     unittest.main()